@@ -0,0 +1,83 @@
+"""Count area computations and time the summary and emit path.
+
+Run from the project root with ``python benchmarks/bench_summary.py [COUNT] [REPEAT]``.
+Timings use the real ``Circle.area`` and report the best of ``REPEAT`` runs; the calls
+are counted in a separate pass with a counting wrapper installed.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import io
+import logging
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from cursor_python import Circle, Settings, generate_random_circles, summarize_circles  # noqa: E402
+from cursor_python.cli import _emit_summary  # noqa: E402
+
+
+def _emit(circles: list[Circle], settings: Settings) -> None:
+    _emit_summary(summarize_circles(circles), settings)
+
+
+def _best_time(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _count_area_calls(func: Callable[[], object]) -> int:
+    calls = 0
+    original_area = Circle.area
+
+    def counting_area(self: Circle) -> float:
+        nonlocal calls
+        calls += 1
+        return original_area(self)
+
+    Circle.area = counting_area  # type: ignore[method-assign]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            func()
+    finally:
+        Circle.area = original_area  # type: ignore[method-assign]
+    return calls
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    circles = generate_random_circles(count, rng=random.Random(0))
+    logging.basicConfig(level=logging.INFO, stream=io.StringIO())
+
+    cases: list[tuple[str, Callable[[], object]]] = [
+        ("summarize_circles", functools.partial(summarize_circles, circles)),
+    ]
+    for output_format in ("json", "text"):
+        cases.append(
+            (
+                f"summarize + emit {output_format}",
+                functools.partial(_emit, circles, Settings(output_format=output_format)),
+            )
+        )
+
+    print(f"{count:,d} circles, best of {repeat}")
+    for label, func in cases:
+        calls = _count_area_calls(func)
+        duration = _best_time(func, repeat)
+        print(f"{label:<24} area() calls={calls:>9,d}  time={duration:.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from .aio import agenerate_circles, asummarize_circles
 from .cli import (
     Settings,
     configure_logging,
@@ -13,20 +14,30 @@ from .cli import (
 from .core import (
     Circle,
     CircleSummary,
+    QuantizedCircleSummary,
+    RadiusHistogram,
     format_circle_stats,
+    generate_quantized_circles,
     generate_random_circles,
     summarize_circles,
 )
+from .distributions import RadiusDistribution
 from .version import __version__
 
 __all__ = [
     "__version__",
     "Circle",
     "CircleSummary",
+    "QuantizedCircleSummary",
+    "RadiusDistribution",
+    "RadiusHistogram",
     "Settings",
+    "agenerate_circles",
+    "asummarize_circles",
     "configure_logging",
     "console_main",
     "format_circle_stats",
+    "generate_quantized_circles",
     "generate_random_circles",
     "main",
     "parse_args",
@@ -0,0 +1,172 @@
+"""Asyncio-friendly counterparts of the circle generation and summary helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import random
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Sequence, Sized
+from concurrent.futures import Executor
+from typing import Any, TypeVar
+
+from .core import (
+    Circle,
+    CircleSummary,
+    _validate_generation_args,
+    generate_random_circles,
+    summarize_circles,
+)
+from .distributions import RadiusDistribution, resolve_distribution
+
+DEFAULT_BATCH_SIZE = 1000
+
+ProgressCallback = Callable[[int, int | None], None]
+"""Called as ``progress(processed, total)`` after each batch; ``total`` may be ``None``."""
+
+_T = TypeVar("_T")
+
+
+async def _run_batch(
+    func: Callable[..., _T],
+    *args: Any,
+    executor: Executor | None,
+    **kwargs: Any,
+) -> _T:
+    """Run one batch of work, always handing control back to the event loop."""
+    if executor is None:
+        result = func(*args, **kwargs)
+        await asyncio.sleep(0)
+        return result
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
+def _summarize_batch(batch: Sequence[Circle]) -> CircleSummary:
+    return summarize_circles(batch)
+
+
+def _check_batch_size(batch_size: int) -> None:
+    if batch_size <= 0:
+        raise ValueError("batch_size must be greater than zero")
+
+
+async def agenerate_circles(
+    count: int,
+    *,
+    min_radius: float = 1.0,
+    max_radius: float = 10.0,
+    rng: random.Random | None = None,
+    distribution: str | RadiusDistribution = "uniform",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    executor: Executor | None = None,
+    progress: ProgressCallback | None = None,
+) -> AsyncIterator[list[Circle]]:
+    """Yield random circles in batches of at most ``batch_size``.
+
+    Control returns to the event loop after every batch, so cancelling the consuming
+    task stops generation at the next batch boundary. When ``executor`` is given the
+    batches are produced there instead of on the loop thread. Batches run one at a
+    time and share ``rng``, so seeded runs produce the same radii as
+    :func:`~cursor_python.core.generate_random_circles`; use a thread pool, since a
+    process pool would receive a copy of the generator state for every batch.
+    """
+    _validate_generation_args(count, min_radius, max_radius)
+    _check_batch_size(batch_size)
+
+    radius_distribution = resolve_distribution(distribution)
+    random_generator = rng or random.Random()
+    produced = 0
+    while produced < count:
+        size = min(batch_size, count - produced)
+        batch = await _run_batch(
+            generate_random_circles,
+            size,
+            executor=executor,
+            min_radius=min_radius,
+            max_radius=max_radius,
+            rng=random_generator,
+            distribution=radius_distribution,
+        )
+        produced += size
+        if progress is not None:
+            progress(produced, count)
+        yield batch
+
+
+async def _abatches(
+    circles: Iterable[Circle] | AsyncIterable[Sequence[Circle]],
+    batch_size: int,
+) -> AsyncIterator[Sequence[Circle]]:
+    if isinstance(circles, AsyncIterable):
+        async for batch in circles:
+            yield batch
+        return
+
+    chunk: list[Circle] = []
+    for circle in circles:
+        chunk.append(circle)
+        if len(chunk) == batch_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def asummarize_circles(
+    circles: Iterable[Circle] | AsyncIterable[Sequence[Circle]],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    executor: Executor | None = None,
+    progress: ProgressCallback | None = None,
+) -> CircleSummary:
+    """Summarise circles incrementally, like :func:`~cursor_python.core.summarize_circles`.
+
+    ``circles`` is either a plain iterable of circles, which is split into batches of
+    ``batch_size``, or an async iterable of batches such as the one returned by
+    :func:`agenerate_circles`. Each batch is summarised separately (in ``executor``
+    when given) and merged, yielding to the event loop in between. Because
+    ``total_area`` and ``average_radius`` are accumulated batch by batch, they equal
+    the synchronous results only up to floating-point rounding.
+    """
+    _check_batch_size(batch_size)
+
+    total = len(circles) if isinstance(circles, Sized) else None
+    collected: list[Circle] = []
+    areas: list[float] = []
+    total_area = 0.0
+    radius_sum = 0.0
+    largest: Circle | None = None
+    largest_area: float | None = None
+    min_radius: float | None = None
+    max_radius: float | None = None
+
+    async for batch in _abatches(circles, batch_size):
+        part = await _run_batch(_summarize_batch, batch, executor=executor)
+        if (
+            part.largest is not None
+            and part.largest_area is not None
+            and part.average_radius is not None
+            and part.min_radius is not None
+            and part.max_radius is not None
+        ):
+            collected.extend(part.circles)
+            areas.extend(part.areas)
+            total_area += part.total_area
+            radius_sum += part.average_radius * len(part.circles)
+            if largest_area is None or part.largest_area > largest_area:
+                largest, largest_area = part.largest, part.largest_area
+            min_radius = part.min_radius if min_radius is None else min(min_radius, part.min_radius)
+            max_radius = part.max_radius if max_radius is None else max(max_radius, part.max_radius)
+        if progress is not None:
+            progress(len(collected), total)
+
+    return CircleSummary(
+        circles=tuple(collected),
+        largest=largest,
+        total_area=total_area,
+        average_radius=radius_sum / len(collected) if collected else None,
+        min_radius=min_radius,
+        max_radius=max_radius,
+        areas=tuple(areas),
+        largest_area=largest_area,
+    )
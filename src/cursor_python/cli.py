@@ -17,7 +17,15 @@ from .config import (
     load_from_file,
     merge_settings,
 )
-from .core import CircleSummary, format_circle_stats, generate_random_circles, summarize_circles
+from .core import (
+    CircleSummary,
+    QuantizedCircleSummary,
+    format_circle_stats,
+    generate_quantized_circles,
+    generate_random_circles,
+    summarize_circles,
+)
+from .distributions import DISTRIBUTION_CHOICES, RadiusDistribution
 from .version import __version__
 
 LOG = logging.getLogger(__name__)
@@ -69,6 +77,27 @@ def build_parser() -> argparse.ArgumentParser:
         type=int,
         help="Seed for the random number generator (enables reproducible runs).",
     )
+    parser.add_argument(
+        "--distribution",
+        choices=DISTRIBUTION_CHOICES,
+        help="Distribution of radii within the radius range (default: uniform).",
+    )
+    parser.add_argument(
+        "--mu",
+        type=float,
+        help="Location parameter of the radius distribution (see the usage docs).",
+    )
+    parser.add_argument(
+        "--sigma",
+        type=float,
+        help="Spread parameter of the normal and lognormal distributions.",
+    )
+    parser.add_argument(
+        "--precision",
+        type=int,
+        metavar="DIGITS",
+        help="Round radii to DIGITS decimals and keep only a count per distinct radius.",
+    )
     parser.add_argument(
         "--log-level",
         choices=LOG_LEVEL_CHOICES,
@@ -128,6 +157,14 @@ def _validate_settings(options: Settings) -> Settings:
         raise ValueError(f"Unsupported output format '{options.output_format}'")
     if options.count < 0:
         raise ValueError("count must be non-negative")
+    if options.precision is not None and options.precision < 0:
+        raise ValueError("precision must be non-negative")
+    if 0 <= options.min_radius <= options.max_radius and options.max_radius > 0:
+        # Builds (and caches) the sampler, so a distribution with no probability mass in
+        # the radius range is reported here rather than during generation.
+        RadiusDistribution(options.distribution, options.mu, options.sigma).sampler(
+            options.min_radius, options.max_radius
+        )
     return options
 
 
@@ -168,7 +205,7 @@ def log_execution_time(func):
 
 
 @log_execution_time
-def run_demo(settings: Settings | int) -> CircleSummary:
+def run_demo(settings: Settings | int) -> CircleSummary | QuantizedCircleSummary:
     """Generate circles, log their stats, and return a summary."""
     options = settings if isinstance(settings, Settings) else Settings(count=settings)
 
@@ -176,22 +213,35 @@ def run_demo(settings: Settings | int) -> CircleSummary:
     if options.seed is not None:
         rng = random_with_seed(options.seed)
 
-    circles = generate_random_circles(
-        options.count,
-        min_radius=options.min_radius,
-        max_radius=options.max_radius,
-        rng=rng,
-    )
-
-    summary = summarize_circles(circles)
-
-    if not summary.circles:
+    distribution = RadiusDistribution(options.distribution, options.mu, options.sigma)
+    summary: CircleSummary | QuantizedCircleSummary
+    if options.precision is None:
+        circles = generate_random_circles(
+            options.count,
+            min_radius=options.min_radius,
+            max_radius=options.max_radius,
+            rng=rng,
+            distribution=distribution,
+        )
+        summary = summarize_circles(circles)
+    else:
+        histogram = generate_quantized_circles(
+            options.count,
+            precision=options.precision,
+            min_radius=options.min_radius,
+            max_radius=options.max_radius,
+            rng=rng,
+            distribution=distribution,
+        )
+        summary = summarize_circles(histogram)
+
+    if not summary.count:
         LOG.warning("No circles generated.")
         return summary
 
     LOG.info(
         "Generated %d circles within radius range %.2f..%.2f",
-        len(summary.circles),
+        summary.count,
         options.min_radius,
         options.max_radius,
     )
@@ -207,18 +257,26 @@ def random_with_seed(seed: int):
     return random.Random(seed)
 
 
-def _emit_summary(summary: CircleSummary, settings: Settings) -> None:
+def _emit_summary(summary: CircleSummary | QuantizedCircleSummary, settings: Settings) -> None:
     if settings.output_format == "json":
         print(json.dumps(summary.as_dict(), indent=2))
         return
 
-    if summary.circles:
-        LOG.info("Circle statistics:\n%s", format_circle_stats(summary.circles))
+    if summary.count:
+        rows = (
+            summary.histogram
+            if isinstance(summary, QuantizedCircleSummary)
+            else summary.circles
+        )
+        LOG.info(
+            "Circle statistics:\n%s",
+            format_circle_stats(rows, areas=summary.areas),
+        )
         if summary.largest:
             LOG.info(
                 "Largest circle: %s (area=%.2f, circumference=%.2f)",
                 summary.largest,
-                summary.largest.area(),
+                summary.largest_area,
                 summary.largest.circumference(),
             )
     else:
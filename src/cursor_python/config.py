@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from .distributions import validate_distribution
+
 try:  # pragma: no cover - exercised indirectly during runtime
     import tomllib  # Python 3.11+
 except ModuleNotFoundError:  # pragma: no cover
@@ -26,6 +28,10 @@ class Settings:
     log_level: str = "INFO"
     log_format: str = "text"
     output_format: str = "text"
+    precision: int | None = None
+    distribution: str = "uniform"
+    mu: float | None = None
+    sigma: float | None = None
 
 
 def load_from_mapping(mapping: Mapping[str, Any]) -> dict[str, Any]:
@@ -82,6 +88,11 @@ def coerce_types(raw: Mapping[str, Any], base: Settings) -> Settings:
         except (TypeError, ValueError) as exc:  # pragma: no cover
             raise ValueError(f"Invalid value for option '{name}': {value!r}") from exc
 
+    distribution = str(raw.get("distribution", base.distribution)).lower()
+    mu = pick("mu", float, base.mu)
+    sigma = pick("sigma", float, base.sigma)
+    validate_distribution(distribution, mu, sigma)
+
     return Settings(
         count=pick("count", int, base.count),
         min_radius=pick("min_radius", float, base.min_radius),
@@ -90,6 +101,10 @@ def coerce_types(raw: Mapping[str, Any], base: Settings) -> Settings:
         log_level=str(raw.get("log_level", base.log_level)).upper(),
         log_format=str(raw.get("log_format", base.log_format)).lower(),
         output_format=str(raw.get("output_format", base.output_format)).lower(),
+        precision=pick("precision", int, base.precision),
+        distribution=distribution,
+        mu=mu,
+        sigma=sigma,
     )
 
 
@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import math
 import random
+from collections import Counter
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
+from typing import Any, overload
+
+from .distributions import RadiusDistribution, resolve_distribution
 
 
 @dataclass(frozen=True, slots=True)
@@ -25,14 +29,7 @@ class Circle:
         return f"Circle(radius={self.radius:.2f})"
 
 
-def generate_random_circles(
-    count: int,
-    *,
-    min_radius: float = 1.0,
-    max_radius: float = 10.0,
-    rng: random.Random | None = None,
-) -> list[Circle]:
-    """Return a list of circles with random radii."""
+def _validate_generation_args(count: int, min_radius: float, max_radius: float) -> None:
     if count < 0:
         raise ValueError("count must be non-negative")
     if min_radius < 0:
@@ -42,27 +39,130 @@ def generate_random_circles(
     if min_radius > max_radius:
         raise ValueError("min_radius cannot be greater than max_radius")
 
-    random_generator = rng or random.Random()
-    return [
-        Circle(random_generator.uniform(min_radius, max_radius))
-        for _ in range(count)
-    ]
 
+def generate_random_circles(
+    count: int,
+    *,
+    min_radius: float = 1.0,
+    max_radius: float = 10.0,
+    rng: random.Random | None = None,
+    distribution: str | RadiusDistribution = "uniform",
+) -> list[Circle]:
+    """Return a list of circles with random radii drawn from ``distribution``."""
+    _validate_generation_args(count, min_radius, max_radius)
+
+    sample = resolve_distribution(distribution).sampler(min_radius, max_radius)
+    return [Circle(radius) for radius in sample(rng or random.Random(), count)]
+
+
+@dataclass(frozen=True, slots=True)
+class RadiusHistogram:
+    """Circles binned by radius rounded to ``precision`` decimal places.
+
+    Only the distinct radii and how often each occurs are stored, so memory grows with
+    the number of buckets rather than the number of circles. Rounding moves each radius
+    by at most ``error_bound`` (half a unit in the last kept decimal place).
+    """
+
+    precision: int
+    buckets: tuple[tuple[float, int], ...]
+
+    @classmethod
+    def from_radii(cls, radii: Iterable[float], precision: int) -> RadiusHistogram:
+        """Bin raw radii into a histogram."""
+        if precision < 0:
+            raise ValueError("precision must be non-negative")
+        counts = Counter(round(radius, precision) for radius in radii)
+        return cls(precision=precision, buckets=tuple(sorted(counts.items())))
+
+    @classmethod
+    def from_circles(cls, circles: Iterable[Circle], precision: int) -> RadiusHistogram:
+        """Bin existing circles into a histogram."""
+        return cls.from_radii((circle.radius for circle in circles), precision)
 
-def format_circle_stats(circles: Iterable[Circle]) -> str:
-    """Return a formatted table of circle statistics."""
+    @property
+    def count(self) -> int:
+        """Return the number of circles represented by the histogram."""
+        return sum(count for _, count in self.buckets)
+
+    @property
+    def error_bound(self) -> float:
+        """Return the largest distance between a stored and an original radius."""
+        return 0.5 * 10.0**-self.precision
+
+
+def generate_quantized_circles(
+    count: int,
+    *,
+    precision: int,
+    min_radius: float = 1.0,
+    max_radius: float = 10.0,
+    rng: random.Random | None = None,
+    distribution: str | RadiusDistribution = "uniform",
+) -> RadiusHistogram:
+    """Return random circles binned into a :class:`RadiusHistogram`.
+
+    Draws the same radii as :func:`generate_random_circles` for a given ``rng`` but
+    never materialises the individual circles.
+    """
+    _validate_generation_args(count, min_radius, max_radius)
+
+    sample = resolve_distribution(distribution).sampler(min_radius, max_radius)
+    return RadiusHistogram.from_radii(sample(rng or random.Random(), count), precision)
+
+
+def format_circle_stats(
+    circles: Iterable[Circle] | RadiusHistogram,
+    *,
+    areas: Iterable[float] | None = None,
+) -> str:
+    """Return a formatted table of circle statistics.
+
+    Pass the ``areas`` column of a summary to reuse its areas instead of recomputing them.
+    """
     lines: list[str] = []
-    for idx, circle in enumerate(circles, 1):
+    if isinstance(circles, RadiusHistogram):
+        precision = circles.precision
+        bucket_circles = [Circle(radius) for radius, _ in circles.buckets]
+        bucket_areas = areas if areas is not None else (c.area() for c in bucket_circles)
+        for idx, (circle, (_, count), area) in enumerate(
+            zip(bucket_circles, circles.buckets, bucket_areas, strict=True), 1
+        ):
+            # Show the bucket at its own precision so neighbouring buckets stay distinct.
+            lines.append(
+                f"{idx:02d}. Circle(radius={circle.radius:.{precision}f}) x{count}: "
+                f"area={area:.2f}, circumference={circle.circumference():.2f}"
+            )
+        return "\n".join(lines)
+
+    if areas is None:
+        circles = list(circles)
+        areas = (circle.area() for circle in circles)
+    for idx, (circle, area) in enumerate(zip(circles, areas, strict=True), 1):
         lines.append(
-            f"{idx:02d}. {circle}: area={circle.area():.2f}, "
+            f"{idx:02d}. {circle}: area={area:.2f}, "
             f"circumference={circle.circumference():.2f}"
         )
     return "\n".join(lines)
 
 
+def _fill_largest_area(summary: CircleSummary | QuantizedCircleSummary) -> None:
+    if summary.largest is None:
+        object.__setattr__(summary, "largest_area", None)
+    elif summary.largest_area is None:
+        object.__setattr__(summary, "largest_area", summary.largest.area())
+
+
 @dataclass(frozen=True, slots=True)
 class CircleSummary:
-    """Statistics that describe a collection of circles."""
+    """Statistics that describe a collection of circles.
+
+    ``areas`` holds the area of each circle in ``circles`` order. It is computed once,
+    when the summary is built, and shared by :meth:`as_dict` and the text output. When
+    it is omitted it is filled in from ``circles``; otherwise it must have one entry per
+    circle. ``largest_area`` is the area of ``largest``; when omitted it is computed
+    from ``largest``.
+    """
 
     circles: tuple[Circle, ...]
     largest: Circle | None
@@ -70,11 +170,25 @@ class CircleSummary:
     average_radius: float | None
     min_radius: float | None
     max_radius: float | None
+    areas: tuple[float, ...] = ()
+    largest_area: float | None = None
+
+    def __post_init__(self) -> None:
+        if not self.areas:
+            object.__setattr__(self, "areas", tuple(circle.area() for circle in self.circles))
+        elif len(self.areas) != len(self.circles):
+            raise ValueError("areas must have one entry per circle")
+        _fill_largest_area(self)
+
+    @property
+    def count(self) -> int:
+        """Return the number of summarised circles."""
+        return len(self.circles)
 
     def as_dict(self) -> dict[str, float | int | list[dict[str, float]] | None]:
         """Return the summary as a JSON-serialisable dictionary."""
         return {
-            "count": len(self.circles),
+            "count": self.count,
             "total_area": self.total_area,
             "average_radius": self.average_radius,
             "min_radius": self.min_radius,
@@ -83,22 +197,131 @@ class CircleSummary:
             if self.largest is None
             else {
                 "radius": self.largest.radius,
-                "area": self.largest.area(),
+                "area": self.largest_area,
                 "circumference": self.largest.circumference(),
             },
             "circles": [
                 {
                     "radius": circle.radius,
-                    "area": circle.area(),
+                    "area": area,
                     "circumference": circle.circumference(),
                 }
-                for circle in self.circles
+                for circle, area in zip(self.circles, self.areas, strict=True)
+            ],
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class QuantizedCircleSummary:
+    """Statistics computed directly from a :class:`RadiusHistogram`.
+
+    With ``eps = histogram.error_bound``, ``n`` circles and ``r_max`` the largest original
+    radius, the radius statistics are within ``eps`` of the exact values and
+    ``total_area`` is within ``n * pi * eps * (2 * r_max + eps)``. ``areas`` holds the
+    area of one circle per bucket, in bucket order; it is filled in when omitted and must
+    otherwise have one entry per bucket. ``largest_area`` is the area of ``largest``; when
+    omitted it is computed from ``largest``.
+    """
+
+    histogram: RadiusHistogram
+    largest: Circle | None
+    total_area: float
+    average_radius: float | None
+    min_radius: float | None
+    max_radius: float | None
+    areas: tuple[float, ...] = ()
+    largest_area: float | None = None
+
+    def __post_init__(self) -> None:
+        buckets = self.histogram.buckets
+        if not self.areas:
+            object.__setattr__(
+                self, "areas", tuple(Circle(radius).area() for radius, _ in buckets)
+            )
+        elif len(self.areas) != len(buckets):
+            raise ValueError("areas must have one entry per bucket")
+        _fill_largest_area(self)
+
+    @property
+    def count(self) -> int:
+        """Return the number of summarised circles."""
+        return self.histogram.count
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the summary as a JSON-serialisable dictionary."""
+        return {
+            "count": self.count,
+            "precision": self.histogram.precision,
+            "total_area": self.total_area,
+            "average_radius": self.average_radius,
+            "min_radius": self.min_radius,
+            "max_radius": self.max_radius,
+            "largest": None
+            if self.largest is None
+            else {
+                "radius": self.largest.radius,
+                "area": self.largest_area,
+                "circumference": self.largest.circumference(),
+            },
+            "buckets": [
+                {
+                    "radius": radius,
+                    "count": count,
+                    "area": area,
+                    "circumference": Circle(radius).circumference(),
+                }
+                for (radius, count), area in zip(self.histogram.buckets, self.areas, strict=True)
             ],
         }
 
 
-def summarize_circles(circles: Sequence[Circle]) -> CircleSummary:
+def _summarize_histogram(histogram: RadiusHistogram) -> QuantizedCircleSummary:
+    buckets = histogram.buckets
+    if not buckets:
+        return QuantizedCircleSummary(
+            histogram=histogram,
+            largest=None,
+            total_area=0.0,
+            average_radius=None,
+            min_radius=None,
+            max_radius=None,
+        )
+
+    total = histogram.count
+    areas = tuple(Circle(radius).area() for radius, _ in buckets)
+    total_area = sum(area * n for area, (_, n) in zip(areas, buckets, strict=True))
+    average_radius = sum(n * radius for radius, n in buckets) / total
+    min_radius = buckets[0][0]
+    max_radius = buckets[-1][0]
+    largest_index = max(range(len(areas)), key=areas.__getitem__)
+
+    return QuantizedCircleSummary(
+        histogram=histogram,
+        largest=Circle(buckets[largest_index][0]),
+        largest_area=areas[largest_index],
+        total_area=total_area,
+        average_radius=average_radius,
+        min_radius=min_radius,
+        max_radius=max_radius,
+        areas=areas,
+    )
+
+
+@overload
+def summarize_circles(circles: RadiusHistogram) -> QuantizedCircleSummary: ...
+
+
+@overload
+def summarize_circles(circles: Sequence[Circle]) -> CircleSummary: ...
+
+
+def summarize_circles(
+    circles: Sequence[Circle] | RadiusHistogram,
+) -> CircleSummary | QuantizedCircleSummary:
     """Build a high-level summary of the provided circles."""
+    if isinstance(circles, RadiusHistogram):
+        return _summarize_histogram(circles)
+
     sequence = tuple(circles)
     if not sequence:
         return CircleSummary(
@@ -110,18 +333,21 @@ def summarize_circles(circles: Sequence[Circle]) -> CircleSummary:
             max_radius=None,
         )
 
-    total_area = sum(circle.area() for circle in sequence)
+    areas = tuple(circle.area() for circle in sequence)
+    total_area = sum(areas)
     average_radius = sum(circle.radius for circle in sequence) / len(sequence)
-    largest = max(sequence, key=lambda circle: circle.area())
+    largest_index = max(range(len(areas)), key=areas.__getitem__)
     min_radius = min(circle.radius for circle in sequence)
     max_radius = max(circle.radius for circle in sequence)
 
     return CircleSummary(
         circles=sequence,
-        largest=largest,
+        largest=sequence[largest_index],
         total_area=total_area,
         average_radius=average_radius,
         min_radius=min_radius,
         max_radius=max_radius,
+        areas=areas,
+        largest_area=areas[largest_index],
     )
 
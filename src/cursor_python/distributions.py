@@ -0,0 +1,172 @@
+"""Radius distributions and the bulk samplers used to draw from them."""
+
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from statistics import NormalDist
+
+DISTRIBUTION_CHOICES = ("uniform", "normal", "lognormal", "exponential", "area")
+TABLE_SIZE = 4097
+_P_EPSILON = 1e-12
+
+Sampler = Callable[[random.Random, int], Iterator[float]]
+"""Called as ``sample(rng, count)``; returns an iterator over ``count`` radii."""
+
+
+@dataclass(frozen=True, slots=True)
+class RadiusDistribution:
+    """Describe how radii are spread over ``[min_radius, max_radius]``.
+
+    ``uniform`` and ``area`` (uniform in area, i.e. square-root transformed) ignore
+    ``mu`` and ``sigma``. ``normal`` uses them as mean and standard deviation (default:
+    the midpoint of the range and a sixth of its width), ``lognormal`` as the mean and
+    standard deviation of ``log(radius)`` (default: the log of the midpoint and 0.25),
+    and ``exponential`` reads ``mu`` as the scale (mean) of the untruncated exponential
+    offset above ``min_radius`` (default: half the range width). Every distribution is
+    truncated to the radius range, so the sampled mean offset of ``exponential`` is
+    ``mu - w / expm1(w / mu)`` for a range width ``w``, below ``mu``.
+
+    ``normal`` and ``lognormal`` are sampled approximately: radii are interpolated
+    linearly between ``TABLE_SIZE`` quantiles spaced evenly in probability. The sampled
+    CDF matches the exact one at every quantile and is off by at most
+    ``1 / (TABLE_SIZE - 1)`` (about 0.00024) in between. Each of the two end segments
+    holds that much probability mass spread evenly over a wide radius interval, so
+    shapes further out in the tails are not reproduced. For ``mu=50`` and ``sigma=2``,
+    for example, the lowest segment covers roughly 36 to 43. Mass beyond the ``1e-12``
+    and ``1 - 1e-12`` quantiles is dropped. The other distributions use exact
+    transforms.
+    """
+
+    kind: str = "uniform"
+    mu: float | None = None
+    sigma: float | None = None
+
+    def __post_init__(self) -> None:
+        validate_distribution(self.kind, self.mu, self.sigma)
+
+    def sampler(self, min_radius: float, max_radius: float) -> Sampler:
+        """Return a bulk sampler for the radius range, built once per parameter set."""
+        return _build_sampler(self, min_radius, max_radius)
+
+
+def validate_distribution(kind: str, mu: float | None, sigma: float | None) -> None:
+    """Raise ``ValueError`` if the distribution name or its parameters are invalid."""
+    if kind not in DISTRIBUTION_CHOICES:
+        raise ValueError(f"Unsupported distribution '{kind}'")
+    if mu is not None and not math.isfinite(mu):
+        raise ValueError("mu must be a finite number")
+    if sigma is not None and not math.isfinite(sigma):
+        raise ValueError("sigma must be a finite number")
+    if sigma is not None and sigma <= 0:
+        raise ValueError("sigma must be greater than zero")
+    if kind == "exponential" and mu is not None and mu <= 0:
+        raise ValueError("mu must be greater than zero for the exponential distribution")
+
+
+def resolve_distribution(distribution: str | RadiusDistribution) -> RadiusDistribution:
+    """Accept either a distribution name or a configured distribution."""
+    if isinstance(distribution, RadiusDistribution):
+        return distribution
+    return RadiusDistribution(distribution)
+
+
+def _inverse_cdf_table(
+    quantile: Callable[[float], float],
+    low_p: float,
+    high_p: float,
+    min_radius: float,
+    max_radius: float,
+) -> tuple[float, ...]:
+    low_p = max(low_p, _P_EPSILON)
+    high_p = min(high_p, 1.0 - _P_EPSILON)
+    if high_p <= low_p:
+        raise ValueError("distribution assigns no probability to the radius range")
+    step = (high_p - low_p) / (TABLE_SIZE - 1)
+    return tuple(
+        min(max(quantile(low_p + step * index), min_radius), max_radius)
+        for index in range(TABLE_SIZE)
+    )
+
+
+def _table_sampler(table: tuple[float, ...]) -> Sampler:
+    last = len(table) - 1
+
+    def sample(rng: random.Random, count: int) -> Iterator[float]:
+        draw = rng.random
+        for _ in range(count):
+            position = draw() * last
+            index = int(position)
+            low = table[index]
+            yield low + (position - index) * (table[index + 1] - low)
+
+    return sample
+
+
+@lru_cache(maxsize=32)
+def _build_sampler(
+    distribution: RadiusDistribution,
+    min_radius: float,
+    max_radius: float,
+) -> Sampler:
+    kind = distribution.kind
+    width = max_radius - min_radius
+
+    if kind == "uniform" or width == 0:
+
+        def sample_uniform(rng: random.Random, count: int) -> Iterator[float]:
+            uniform = rng.uniform
+            return (uniform(min_radius, max_radius) for _ in range(count))
+
+        return sample_uniform
+
+    if kind == "area":
+        low_sq = min_radius**2
+        span_sq = max_radius**2 - low_sq
+
+        def sample_area(rng: random.Random, count: int) -> Iterator[float]:
+            draw = rng.random
+            return (math.sqrt(low_sq + draw() * span_sq) for _ in range(count))
+
+        return sample_area
+
+    if kind == "exponential":
+        mean = distribution.mu if distribution.mu is not None else width / 2
+        mass = -math.expm1(-width / mean)
+
+        def sample_exponential(rng: random.Random, count: int) -> Iterator[float]:
+            draw = rng.random
+            return (min_radius - mean * math.log1p(-draw() * mass) for _ in range(count))
+
+        return sample_exponential
+
+    midpoint = (min_radius + max_radius) / 2
+    if kind == "normal":
+        normal = NormalDist(
+            distribution.mu if distribution.mu is not None else midpoint,
+            distribution.sigma if distribution.sigma is not None else width / 6,
+        )
+        table = _inverse_cdf_table(
+            normal.inv_cdf,
+            normal.cdf(min_radius),
+            normal.cdf(max_radius),
+            min_radius,
+            max_radius,
+        )
+        return _table_sampler(table)
+
+    log_normal = NormalDist(
+        distribution.mu if distribution.mu is not None else math.log(midpoint),
+        distribution.sigma if distribution.sigma is not None else 0.25,
+    )
+    table = _inverse_cdf_table(
+        lambda p: math.exp(log_normal.inv_cdf(p)),
+        log_normal.cdf(math.log(min_radius)) if min_radius > 0 else 0.0,
+        log_normal.cdf(math.log(max_radius)),
+        min_radius,
+        max_radius,
+    )
+    return _table_sampler(table)
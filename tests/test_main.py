@@ -1,19 +1,29 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import math
 import random
+import statistics
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
 from cursor_python import (
     Circle,
+    CircleSummary,
+    RadiusDistribution,
+    RadiusHistogram,
     Settings,
+    agenerate_circles,
+    asummarize_circles,
     format_circle_stats,
+    generate_quantized_circles,
     generate_random_circles,
     main,
     run_demo,
+    summarize_circles,
 )
 
 
@@ -33,6 +43,98 @@ def test_generate_random_circles_reproducible_seed() -> None:
     )
 
 
+@pytest.mark.parametrize("distribution", ["normal", "lognormal", "exponential", "area"])
+def test_generate_random_circles_distributions(distribution: str) -> None:
+    first = generate_random_circles(
+        200, min_radius=2.0, max_radius=4.0, rng=random.Random(8), distribution=distribution
+    )
+    second = generate_random_circles(
+        200, min_radius=2.0, max_radius=4.0, rng=random.Random(8), distribution=distribution
+    )
+    assert first == second
+    assert all(2.0 <= circle.radius <= 4.0 for circle in first)
+
+
+def _expected_exponential_offset(scale: float, width: float) -> float:
+    return scale - width / math.expm1(width / scale)
+
+
+@pytest.mark.parametrize(
+    ("distribution", "min_radius", "max_radius", "statistic", "expected"),
+    [
+        # Uniform in area: r**2 is uniform on [min**2, max**2].
+        ("area", 2.0, 4.0, lambda r: r**2, (2.0**2 + 4.0**2) / 2),
+        # Truncated exponential: mean offset above min_radius for scale mu=1, width 2.
+        (
+            RadiusDistribution("exponential", mu=1.0),
+            2.0,
+            4.0,
+            lambda r: r - 2.0,
+            _expected_exponential_offset(1.0, 2.0),
+        ),
+        # Lognormal over a wide range: log(r) is approximately N(mu, sigma).
+        (
+            RadiusDistribution("lognormal", mu=math.log(5.0), sigma=0.25),
+            0.01,
+            1000.0,
+            math.log,
+            math.log(5.0),
+        ),
+    ],
+)
+def test_distribution_shapes(
+    distribution: str | RadiusDistribution,
+    min_radius: float,
+    max_radius: float,
+    statistic,
+    expected: float,
+) -> None:
+    circles = generate_random_circles(
+        20_000,
+        min_radius=min_radius,
+        max_radius=max_radius,
+        rng=random.Random(11),
+        distribution=distribution,
+    )
+    values = [statistic(circle.radius) for circle in circles]
+    assert statistics.fmean(values) == pytest.approx(expected, rel=0.01)
+
+
+def test_normal_distribution_parameters() -> None:
+    circles = generate_random_circles(
+        2000,
+        min_radius=0.0,
+        max_radius=100.0,
+        rng=random.Random(1),
+        distribution=RadiusDistribution("normal", mu=50.0, sigma=2.0),
+    )
+    radii = [circle.radius for circle in circles]
+    assert sum(radii) / len(radii) == pytest.approx(50.0, abs=0.2)
+    assert statistics.stdev(radii) == pytest.approx(2.0, rel=0.1)
+
+
+def test_invalid_distribution_settings_rejected(monkeypatch) -> None:
+    monkeypatch.setattr("sys.argv", ["cursor-python", "--distribution", "normal", "--sigma", "0"])
+    assert main() == 2
+    monkeypatch.setattr("sys.argv", ["cursor-python"])
+    monkeypatch.setenv("CURSOR_PYTHON_DISTRIBUTION", "cauchy")
+    assert main() == 2
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--distribution", "normal", "--mu", "nan"],
+        ["--distribution", "normal", "--sigma", "inf"],
+        ["--distribution", "exponential", "--mu", "inf"],
+        ["--distribution", "normal", "--mu", "1000", "--sigma", "1"],
+    ],
+)
+def test_unusable_distribution_parameters_rejected(monkeypatch, argv: list[str]) -> None:
+    monkeypatch.setattr("sys.argv", ["cursor-python", *argv, "--output-format", "json"])
+    assert main() == 2
+
+
 def test_generate_random_circles_negative_count() -> None:
     with pytest.raises(ValueError):
         generate_random_circles(-1)
@@ -43,6 +145,158 @@ def test_generate_random_circles_invalid_radius_range() -> None:
         generate_random_circles(1, min_radius=2.0, max_radius=1.0)
 
 
+@pytest.mark.parametrize("use_executor", [False, True])
+def test_agenerate_circles_matches_sync_generation(use_executor: bool) -> None:
+    progress: list[tuple[int, int | None]] = []
+
+    async def collect() -> list[list[Circle]]:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            return [
+                batch
+                async for batch in agenerate_circles(
+                    5,
+                    rng=random.Random(42),
+                    batch_size=2,
+                    executor=executor if use_executor else None,
+                    progress=lambda done, total: progress.append((done, total)),
+                )
+            ]
+
+    batches = asyncio.run(collect())
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    expected = generate_random_circles(5, rng=random.Random(42))
+    assert [circle for batch in batches for circle in batch] == expected
+    assert progress == [(2, 5), (4, 5), (5, 5)]
+
+
+def test_agenerate_circles_can_be_cancelled() -> None:
+    async def scenario() -> int:
+        seen = 0
+
+        async def consume() -> None:
+            nonlocal seen
+            async for batch in agenerate_circles(10**9, batch_size=10):
+                seen += len(batch)
+
+        task = asyncio.create_task(consume())
+        for _ in range(3):
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return seen
+
+    assert 0 < asyncio.run(scenario()) < 10**9
+
+
+def test_asummarize_circles_matches_sync_summary() -> None:
+    circles = generate_random_circles(7, rng=random.Random(3))
+    expected = summarize_circles(circles)
+
+    async def summarise() -> tuple[CircleSummary, CircleSummary]:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            from_list = await asummarize_circles(circles, batch_size=3, executor=executor)
+            from_stream = await asummarize_circles(
+                agenerate_circles(7, rng=random.Random(3), batch_size=4)
+            )
+        return from_list, from_stream
+
+    for summary in asyncio.run(summarise()):
+        assert summary.circles == expected.circles
+        assert summary.largest == expected.largest
+        assert summary.total_area == pytest.approx(expected.total_area)
+        assert summary.average_radius == pytest.approx(expected.average_radius)
+        assert summary.min_radius == expected.min_radius
+        assert summary.max_radius == expected.max_radius
+
+
+def test_quantized_summary_within_error_bound() -> None:
+    exact = summarize_circles(generate_random_circles(500, rng=random.Random(5)))
+    histogram = generate_quantized_circles(500, precision=1, rng=random.Random(5))
+    quantized = summarize_circles(histogram)
+
+    assert quantized.count == 500
+    assert len(histogram.buckets) <= 91
+    eps = histogram.error_bound
+    assert abs(quantized.average_radius - exact.average_radius) <= eps
+    assert abs(quantized.max_radius - exact.max_radius) <= eps
+    assert abs(quantized.total_area - exact.total_area) <= (
+        500 * math.pi * eps * (2 * exact.max_radius + eps)
+    )
+
+
+def test_radius_histogram_formatting() -> None:
+    histogram = RadiusHistogram.from_circles(
+        [Circle(radius=1.004), Circle(radius=0.996), Circle(radius=2.0)], precision=2
+    )
+    assert histogram.buckets == ((1.0, 2), (2.0, 1))
+    lines = format_circle_stats(histogram).splitlines()
+    assert lines[0].startswith("01. Circle(radius=1.00) x2:")
+    assert lines[1].startswith("02. Circle(radius=2.00) x1:")
+
+
+def test_summary_computes_each_area_once(monkeypatch) -> None:
+    circles = [Circle(radius=1.0), Circle(radius=3.0), Circle(radius=2.0)]
+    calls = 0
+    original_area = Circle.area
+
+    def counting_area(self: Circle) -> float:
+        nonlocal calls
+        calls += 1
+        return original_area(self)
+
+    monkeypatch.setattr(Circle, "area", counting_area)
+    summary = summarize_circles(circles)
+    payload = summary.as_dict()
+    stats = format_circle_stats(summary.circles, areas=summary.areas)
+
+    assert calls == len(circles)
+    assert summary.largest == Circle(radius=3.0)
+    assert payload["largest"]["area"] == pytest.approx(math.pi * 9.0)
+    assert summary.total_area == pytest.approx(math.pi * 14.0)
+    assert [item["area"] for item in payload["circles"]] == list(summary.areas)
+    assert stats == format_circle_stats(circles)
+
+
+def test_summary_largest_is_chosen_by_area() -> None:
+    summary = summarize_circles([Circle(radius=-5.0), Circle(radius=3.0)])
+    assert summary.largest == Circle(radius=-5.0)
+    assert summary.largest_area == pytest.approx(math.pi * 25.0)
+
+
+def test_hand_built_summary_derives_largest_area_from_largest() -> None:
+    summary = CircleSummary(
+        circles=(Circle(radius=1.0), Circle(radius=2.0)),
+        largest=Circle(radius=2.0),
+        total_area=5 * math.pi,
+        average_radius=1.5,
+        min_radius=1.0,
+        max_radius=2.0,
+    )
+    assert summary.largest_area == pytest.approx(math.pi * 4.0)
+    assert summary.as_dict()["largest"]["area"] == summary.largest_area
+
+
+def test_summary_rejects_mismatched_areas() -> None:
+    with pytest.raises(ValueError):
+        CircleSummary(
+            circles=(Circle(radius=1.0),),
+            largest=Circle(radius=1.0),
+            total_area=math.pi,
+            average_radius=1.0,
+            min_radius=1.0,
+            max_radius=1.0,
+            areas=(1.0, 2.0),
+        )
+
+
+def test_radius_histogram_formatting_keeps_precision() -> None:
+    histogram = RadiusHistogram.from_radii([1.234, 1.2341], precision=4)
+    lines = format_circle_stats(histogram).splitlines()
+    assert lines[0].startswith("01. Circle(radius=1.2340) x1:")
+    assert lines[1].startswith("02. Circle(radius=1.2341) x1:")
+
+
 def test_format_circle_stats() -> None:
     circles = [Circle(radius=1.0), Circle(radius=2.0)]
     stats = format_circle_stats(circles)
@@ -94,6 +348,30 @@ def test_main_json_output(monkeypatch, capsys) -> None:
     assert payload["largest"]["radius"] == pytest.approx(payload["circles"][0]["radius"])
 
 
+def test_main_json_output_quantized(monkeypatch, capsys) -> None:
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "cursor-python",
+            "--count",
+            "20",
+            "--seed",
+            "3",
+            "--precision",
+            "0",
+            "--output-format",
+            "json",
+        ],
+    )
+    exit_code = main()
+    assert exit_code == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["count"] == 20
+    assert payload["precision"] == 0
+    assert sum(bucket["count"] for bucket in payload["buckets"]) == 20
+    assert "circles" not in payload
+
+
 def test_main_reads_config_file(monkeypatch, tmp_path: Path) -> None:
     config_path = tmp_path / "cursor-python.toml"
     config_path.write_text(